@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from fastembed import SparseEmbedding
@@ -90,6 +91,22 @@ class AirweaveSystemMetadata(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+@lru_cache(maxsize=None)
+def _flagged_field_names(entity_class: type, flag_key: str) -> Tuple[str, ...]:
+    """Return the names of fields carrying an AirweaveField flag, cached per entity class.
+
+    Flags live in class-level field metadata, so the scan only needs to run once per
+    class instead of on every entity instantiation.
+    """
+    flagged_fields = []
+    for field_name, field_info in entity_class.model_fields.items():
+        json_extra = field_info.json_schema_extra
+        if json_extra and isinstance(json_extra, dict):
+            if json_extra.get(flag_key):
+                flagged_fields.append(field_name)
+    return tuple(flagged_fields)
+
+
 class BaseEntity(BaseModel):
     """Base entity schema."""
 
@@ -148,14 +165,9 @@ class BaseEntity(BaseModel):
         for flag in unique_flags:
             flag_key = flag.value if hasattr(flag, "value") else flag
             flag_label = flag.value if hasattr(flag, "value") else str(flag)
-            flagged_fields = []
 
             # Find all fields with this flag
-            for field_name, field_info in self.__class__.model_fields.items():
-                json_extra = field_info.json_schema_extra
-                if json_extra and isinstance(json_extra, dict):
-                    if json_extra.get(flag_key):
-                        flagged_fields.append(field_name)
+            flagged_fields = _flagged_field_names(self.__class__, flag_key)
 
             # Validate exactly one field has this flag
             if len(flagged_fields) == 0:
@@ -197,14 +209,9 @@ class BaseEntity(BaseModel):
         for flag in optional_flags:
             flag_key = flag.value if hasattr(flag, "value") else flag
             flag_label = flag.value if hasattr(flag, "value") else str(flag)
-            flagged_fields = []
 
             # Find all fields with this flag
-            for field_name, field_info in self.__class__.model_fields.items():
-                json_extra = field_info.json_schema_extra
-                if json_extra and isinstance(json_extra, dict):
-                    if json_extra.get(flag_key):
-                        flagged_fields.append(field_name)
+            flagged_fields = _flagged_field_names(self.__class__, flag_key)
 
             # Validate at most one field has this flag
             if len(flagged_fields) > 1:
@@ -1,5 +1,6 @@
 """GitLab source implementation for syncing projects, files, issues, and merge requests."""
 
+import asyncio
 import base64
 import mimetypes
 from datetime import datetime
@@ -62,10 +63,13 @@ class GitLabSource(BaseSource):
 
     @staticmethod
     def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-        """Parse GitLab ISO8601 timestamps into aware datetimes."""
+        """Parse GitLab ISO8601 timestamps into aware datetimes.
+
+        Python 3.11+ parses the trailing ``Z`` natively, so no string rewrite is needed.
+        """
         if not value:
             return None
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return datetime.fromisoformat(value)
 
     @classmethod
     def _require_datetime(cls, value: Optional[str], field_name: str) -> datetime:
@@ -92,12 +96,17 @@ class GitLabSource(BaseSource):
         instance.access_token = access_token
 
         # Parse config fields
-        if config:
-            instance.project_id = config.get("project_id")
-            instance.branch = config.get("branch", "")
-        else:
-            instance.project_id = None
-            instance.branch = ""
+        config = config or {}
+        instance.project_id = config.get("project_id")
+        instance.branch = config.get("branch", "")
+
+        # Concurrency configuration (mirrors other connectors)
+        instance.batch_generation = bool(config.get("batch_generation", True))
+        instance.batch_size = int(config.get("batch_size", 8))
+        instance.max_queue_size = int(config.get("max_queue_size", 200))
+        instance.preserve_order = bool(config.get("preserve_order", False))
+        instance.stop_on_error = bool(config.get("stop_on_error", False))
+        instance._file_semaphore = asyncio.Semaphore(instance.batch_size)
 
         return instance
 
@@ -107,9 +116,9 @@ class GitLabSource(BaseSource):
         wait=wait_rate_limit_with_backoff,
         reraise=True,
     )
-    async def _get_with_auth(
+    async def _get_response_with_auth(
         self, client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> httpx.Response:
         """Make authenticated API request using OAuth access token.
 
         Args:
@@ -118,7 +127,7 @@ class GitLabSource(BaseSource):
             params: Optional query parameters
 
         Returns:
-            JSON response
+            The successful HTTP response
         """
         # Get a valid token (will refresh if needed)
         access_token = await self.get_access_token()
@@ -143,7 +152,10 @@ class GitLabSource(BaseSource):
                         from airweave.core.exceptions import TokenRefreshError
 
                         new_token = await self.token_manager.refresh_on_unauthorized()
-                        headers = {"Authorization": f"Bearer {new_token}"}
+                        headers = {
+                            "Authorization": f"Bearer {new_token}",
+                            "Accept": "application/json",
+                        }
 
                         # Retry with new token
                         self.logger.debug(f"Retrying request with refreshed token: {url}")
@@ -157,7 +169,7 @@ class GitLabSource(BaseSource):
                     response.raise_for_status()
 
             response.raise_for_status()
-            return response.json()
+            return response
 
         except httpx.HTTPStatusError as e:
             self.logger.error(f"HTTP error from GitLab API: {e.response.status_code} for {url}")
@@ -166,10 +178,10 @@ class GitLabSource(BaseSource):
             self.logger.error(f"Unexpected error accessing GitLab API: {url}, {str(e)}")
             raise
 
-    async def _get_paginated_results(
+    async def _get_with_auth(
         self, client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
-        """Get all pages of results from a paginated GitLab API endpoint.
+    ) -> Dict[str, Any]:
+        """Make authenticated API request and return the decoded JSON body.
 
         Args:
             client: HTTP client
@@ -177,7 +189,27 @@ class GitLabSource(BaseSource):
             params: Optional query parameters
 
         Returns:
-            List of all results from all pages
+            JSON response
+        """
+        response = await self._get_response_with_auth(client, url, params)
+        return response.json()
+
+    async def _get_paginated_results(
+        self, client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream results from a paginated GitLab API endpoint.
+
+        Items are yielded page by page, so only the current page is held in memory
+        and callers can start processing before the last page has been fetched. The
+        next page is requested in the background while the current page is consumed.
+
+        Args:
+            client: HTTP client
+            url: API endpoint URL
+            params: Optional query parameters
+
+        Yields:
+            Individual results from each page
         """
         if params is None:
             params = {}
@@ -185,70 +217,40 @@ class GitLabSource(BaseSource):
         # Set per_page to maximum to minimize requests
         params["per_page"] = 100
 
-        all_results = []
         page = 1
+        next_page: Optional[asyncio.Task] = None
 
-        while True:
-            params["page"] = page
-            token = await self.get_access_token()
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/json",
-            }
-
-            try:
-                response = await client.get(url, headers=headers, params=params)
-
-                # Handle 401 Unauthorized - token might have expired
-                if response.status_code == 401:
-                    self.logger.warning(f"Received 401 Unauthorized for {url}, refreshing token...")
-
-                    if self.token_manager:
-                        try:
-                            # Force refresh the token
-                            from airweave.core.exceptions import TokenRefreshError
-
-                            new_token = await self.token_manager.refresh_on_unauthorized()
-                            headers = {
-                                "Authorization": f"Bearer {new_token}",
-                                "Accept": "application/json",
-                            }
-
-                            # Retry with new token
-                            self.logger.debug(
-                                f"Retrying paginated request with refreshed token: {url}"
-                            )
-                            response = await client.get(url, headers=headers, params=params)
-
-                        except TokenRefreshError as e:
-                            self.logger.error(f"Failed to refresh token: {str(e)}")
-                            response.raise_for_status()
-                    else:
-                        self.logger.error("No token manager available to refresh expired token")
-                        response.raise_for_status()
-
-                response.raise_for_status()
+        try:
+            response = await self._get_response_with_auth(client, url, {**params, "page": page})
 
+            while True:
                 results = response.json()
                 if not results:  # Empty page means we're done
                     break
 
-                all_results.extend(results)
-
-                # Check if there's a next page via header
-                if "x-next-page" not in response.headers or not response.headers["x-next-page"]:
-                    break
+                # Prefetch the next page (advertised via header) while this one is consumed
+                if response.headers.get("x-next-page"):
+                    page += 1
+                    next_page = asyncio.create_task(
+                        self._get_response_with_auth(client, url, {**params, "page": page})
+                    )
 
-                page += 1
+                for result in results:
+                    yield result
 
-            except httpx.HTTPStatusError as e:
-                self.logger.error(f"HTTP error from GitLab API: {e.response.status_code} for {url}")
-                raise
-            except Exception as e:
-                self.logger.error(f"Unexpected error accessing GitLab API: {url}, {str(e)}")
-                raise
+                if next_page is None:
+                    break
 
-        return all_results
+                response = await next_page
+                next_page = None
+        finally:
+            # Don't leave a prefetch running if the consumer stops early
+            if next_page is not None:
+                if not next_page.done():
+                    next_page.cancel()
+                elif not next_page.cancelled():
+                    # Retrieve a failed prefetch's error so asyncio doesn't report it
+                    next_page.exception()
 
     def _detect_language_from_extension(self, file_path: str) -> str:
         """Detect programming language from file extension.
@@ -306,6 +308,17 @@ class GitLabSource(BaseSource):
         url = f"{self.BASE_URL}/projects/{project_id}"
         project_data = await self._get_with_auth(client, url)
 
+        return self._create_project_entity(project_data)
+
+    def _create_project_entity(self, project_data: Dict[str, Any]) -> GitLabProjectEntity:
+        """Create a project entity from a GitLab project payload.
+
+        Args:
+            project_data: Project data from the single-project or project list endpoint
+
+        Returns:
+            Project entity
+        """
         return GitLabProjectEntity(
             breadcrumbs=[],
             project_id=project_data["id"],
@@ -346,18 +359,18 @@ class GitLabSource(BaseSource):
             Issue entities
         """
         url = f"{self.BASE_URL}/projects/{project_id}/issues"
-        issues = await self._get_paginated_results(client, url)
+        # Oldest first so issues created mid-sync land on later pages instead of shifting
+        # already-fetched ones onto the next page
+        params = {"order_by": "created_at", "sort": "asc"}
 
-        for issue in issues:
+        async for issue in self._get_paginated_results(client, url, params):
+            created_at = self._require_datetime(issue.get("created_at"), "issue.created_at")
             yield GitLabIssueEntity(
                 breadcrumbs=project_breadcrumbs,
                 issue_id=issue["id"],
                 title=issue["title"],
-                created_at=self._require_datetime(issue.get("created_at"), "issue.created_at"),
-                updated_at=self._require_datetime(
-                    issue.get("updated_at") or issue.get("created_at"),
-                    "issue.updated_at",
-                ),
+                created_at=created_at,
+                updated_at=self._parse_datetime(issue.get("updated_at")) or created_at,
                 description=issue.get("description"),
                 state=issue["state"],
                 closed_at=self._parse_datetime(issue.get("closed_at")),
@@ -365,7 +378,7 @@ class GitLabSource(BaseSource):
                 author=issue.get("author", {}),
                 assignees=issue.get("assignees", []),
                 milestone=issue.get("milestone"),
-                project_id=str(project_id),
+                project_id=project_id,
                 iid=issue["iid"],
                 web_url_value=issue.get("web_url"),
                 user_notes_count=issue.get("user_notes_count", 0),
@@ -387,18 +400,16 @@ class GitLabSource(BaseSource):
             Merge request entities
         """
         url = f"{self.BASE_URL}/projects/{project_id}/merge_requests"
-        merge_requests = await self._get_paginated_results(client, url)
+        params = {"order_by": "created_at", "sort": "asc"}
 
-        for mr in merge_requests:
+        async for mr in self._get_paginated_results(client, url, params):
+            created_at = self._require_datetime(mr.get("created_at"), "merge_request.created_at")
             yield GitLabMergeRequestEntity(
                 breadcrumbs=project_breadcrumbs,
                 merge_request_id=mr["id"],
                 title=mr["title"],
-                created_at=self._require_datetime(mr.get("created_at"), "merge_request.created_at"),
-                updated_at=self._require_datetime(
-                    mr.get("updated_at") or mr.get("created_at"),
-                    "merge_request.updated_at",
-                ),
+                created_at=created_at,
+                updated_at=self._parse_datetime(mr.get("updated_at")) or created_at,
                 description=mr.get("description"),
                 state=mr["state"],
                 merged_at=self._parse_datetime(mr.get("merged_at")),
@@ -410,7 +421,7 @@ class GitLabSource(BaseSource):
                 source_branch=mr["source_branch"],
                 target_branch=mr["target_branch"],
                 milestone=mr.get("milestone"),
-                project_id=str(project_id),
+                project_id=project_id,
                 iid=mr["iid"],
                 web_url_value=mr.get("web_url"),
                 merge_status=mr.get("merge_status", "unchecked"),
@@ -483,22 +494,23 @@ class GitLabSource(BaseSource):
         url = f"{self.BASE_URL}/projects/{project_id}/repository/tree"
         params = {"ref": branch, "path": path, "per_page": 100}
 
-        try:
-            contents = await self._get_paginated_results(client, url, params)
+        # Files need one request each, so they are collected and fetched after the listing
+        file_paths: List[str] = []
 
+        try:
             # Process each item in the directory
-            for item in contents:
+            async for item in self._get_paginated_results(client, url, params):
                 item_path = item["path"]
                 item_type = item["type"]
 
                 if item_type == "tree":  # Directory
                     # Create directory entity
                     dir_entity = GitLabDirectoryEntity(
-                        breadcrumbs=breadcrumbs.copy(),
+                        breadcrumbs=breadcrumbs,
                         full_path=f"{project_id}/{item_path}",
                         name=Path(item_path).name or item_path,
                         path=item_path,
-                        project_id=str(project_id),
+                        project_id=project_id,
                         project_path=project_path,
                         branch=branch,
                         web_url_value=f"https://gitlab.com/{project_path}/-/tree/{branch}/{item_path}",
@@ -515,7 +527,7 @@ class GitLabSource(BaseSource):
                     yield dir_entity
 
                     # Create updated breadcrumb chain for children
-                    dir_breadcrumbs = breadcrumbs.copy() + [dir_breadcrumb]
+                    dir_breadcrumbs = breadcrumbs + [dir_breadcrumb]
 
                     # Recursively traverse this directory (DFS)
                     async for child_entity in self._traverse_directory(
@@ -530,15 +542,72 @@ class GitLabSource(BaseSource):
                         yield child_entity
 
                 elif item_type == "blob":  # File
-                    # Process the file and yield entities
-                    async for file_entity in self._process_file(
-                        client, project_id, project_path, item_path, branch, breadcrumbs
-                    ):
-                        yield file_entity
+                    file_paths.append(item_path)
 
         except Exception as e:
             self.logger.error(f"Error traversing path {path}: {str(e)}")
 
+        # Files listed before a failing page are still processed
+        try:
+            async for file_entity in self._process_files(
+                client, project_id, project_path, file_paths, branch, breadcrumbs
+            ):
+                yield file_entity
+        except Exception as e:
+            self.logger.error(f"Error processing files in path {path}: {str(e)}")
+
+    async def _process_files(
+        self,
+        client: httpx.AsyncClient,
+        project_id: str,
+        project_path: str,
+        file_paths: List[str],
+        branch: str,
+        breadcrumbs: List[Breadcrumb],
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Process the files of a directory, concurrently when batch generation is enabled.
+
+        Args:
+            client: HTTP client
+            project_id: Project ID
+            project_path: Project path with namespace
+            file_paths: Paths of the files in the directory
+            branch: Branch name
+            breadcrumbs: Current breadcrumb chain
+
+        Yields:
+            File entities
+        """
+
+        async def _bounded_file_worker(file_path: str):
+            # Directories of concurrently processed projects share one bound on file fetches
+            async with self._file_semaphore:
+                file_entities = [
+                    entity
+                    async for entity in self._process_file(
+                        client, project_id, project_path, file_path, branch, breadcrumbs
+                    )
+                ]
+            for file_entity in file_entities:
+                yield file_entity
+
+        if getattr(self, "batch_generation", False):
+            async for file_entity in self.process_entities_concurrent(
+                items=file_paths,
+                worker=_bounded_file_worker,
+                batch_size=getattr(self, "batch_size", 8),
+                preserve_order=getattr(self, "preserve_order", False),
+                stop_on_error=getattr(self, "stop_on_error", False),
+                max_queue_size=getattr(self, "max_queue_size", 200),
+            ):
+                yield file_entity
+        else:
+            for file_path in file_paths:
+                async for file_entity in self._process_file(
+                    client, project_id, project_path, file_path, branch, breadcrumbs
+                ):
+                    yield file_entity
+
     async def _process_file(
         self,
         client: httpx.AsyncClient,
@@ -605,7 +674,7 @@ class GitLabSource(BaseSource):
 
                 # Create file entity (without content field)
                 file_entity = GitLabCodeFileEntity(
-                    breadcrumbs=breadcrumbs.copy(),
+                    breadcrumbs=breadcrumbs,
                     full_path=f"{project_id}/{file_path}",
                     name=file_name,
                     branch=branch,
@@ -622,7 +691,7 @@ class GitLabSource(BaseSource):
                     commit_id=file_data["blob_id"],
                     # API fields (GitLab-specific)
                     blob_id=file_data["blob_id"],
-                    project_id=str(project_id),
+                    project_id=project_id,
                     project_path=project_path,
                     line_count=line_count,
                     web_url_value=f"https://gitlab.com/{project_path}/-/blob/{branch}/{file_path}",
@@ -649,30 +718,32 @@ class GitLabSource(BaseSource):
         except Exception as e:
             self.logger.error(f"Error processing file {file_path}: {str(e)}")
 
-    async def _get_projects(self, client: httpx.AsyncClient) -> List[GitLabProjectEntity]:
+    async def _get_projects(
+        self, client: httpx.AsyncClient
+    ) -> AsyncGenerator[GitLabProjectEntity, None]:
         """Get accessible projects based on configuration.
 
         Args:
             client: HTTP client
 
-        Returns:
-            List of project entities
+        Yields:
+            Project entities
         """
         if hasattr(self, "project_id") and self.project_id:
-            return [await self._get_project_info(client, self.project_id)]
+            yield await self._get_project_info(client, self.project_id)
+            return
 
-        # All accessible projects
+        # All accessible projects. The non-simple list already carries the full project
+        # representation, so entities are built from it without a per-project request.
         url = f"{self.BASE_URL}/projects"
-        params = {"membership": True, "simple": False}
-        projects_data = await self._get_paginated_results(client, url, params)
-        projects = []
-        for proj_data in projects_data:
+        params = {"membership": True, "simple": False, "order_by": "id", "sort": "asc"}
+        async for proj_data in self._get_paginated_results(client, url, params):
             try:
-                project = await self._get_project_info(client, str(proj_data["id"]))
-                projects.append(project)
+                project = self._create_project_entity(proj_data)
             except Exception as e:
                 self.logger.warning(f"Failed to get project {proj_data.get('id')}: {e}")
-        return projects
+                continue
+            yield project
 
     async def _process_project(
         self,
@@ -732,6 +803,49 @@ class GitLabSource(BaseSource):
         except Exception as e:
             self.logger.warning(f"Failed to get MRs for {project.path_with_namespace}: {e}")
 
+    async def _generate_project_entities(
+        self, client: httpx.AsyncClient, project: GitLabProjectEntity
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Yield a project entity followed by all entities within the project.
+
+        Args:
+            client: HTTP client
+            project: Project entity
+
+        Yields:
+            Project, directory, file, issue, and merge request entities
+        """
+        yield project
+
+        project_breadcrumb = Breadcrumb(
+            entity_id=str(project.project_id),
+            name=project.name,
+            entity_type=GitLabProjectEntity.__name__,
+        )
+        project_breadcrumbs = [project_breadcrumb]
+
+        # Process all entities within the project
+        async for entity in self._process_project(client, project, project_breadcrumbs):
+            yield entity
+
+    async def _process_projects_concurrent(
+        self, client: httpx.AsyncClient
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Process projects concurrently using bounded concurrency."""
+        # List every project before starting workers: process_entities_concurrent starts a
+        # worker per item as it arrives and won't cancel them if a later listing page fails
+        projects = [project async for project in self._get_projects(client)]
+
+        async for entity in self.process_entities_concurrent(
+            items=projects,
+            worker=lambda project: self._generate_project_entities(client, project),
+            batch_size=getattr(self, "batch_size", 8),
+            preserve_order=getattr(self, "preserve_order", False),
+            stop_on_error=getattr(self, "stop_on_error", False),
+            max_queue_size=getattr(self, "max_queue_size", 200),
+        ):
+            yield entity
+
     async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
         """Generate entities from GitLab.
 
@@ -743,23 +857,14 @@ class GitLabSource(BaseSource):
             user_entity = await self._get_current_user(client)
             yield user_entity
 
-            # Get accessible projects
-            projects = await self._get_projects(client)
-
-            # Process each project
-            for project in projects:
-                yield project
-
-                project_breadcrumb = Breadcrumb(
-                    entity_id=str(project.project_id),
-                    name=project.name,
-                    entity_type=GitLabProjectEntity.__name__,
-                )
-                project_breadcrumbs = [project_breadcrumb]
-
-                # Process all entities within the project
-                async for entity in self._process_project(client, project, project_breadcrumbs):
+            if getattr(self, "batch_generation", False):
+                async for entity in self._process_projects_concurrent(client):
                     yield entity
+            else:
+                # Process each accessible project as it is discovered
+                async for project in self._get_projects(client):
+                    async for entity in self._generate_project_entities(client, project):
+                        yield entity
 
     async def validate(self) -> bool:
         """Verify GitLab OAuth token by pinging the /user endpoint."""
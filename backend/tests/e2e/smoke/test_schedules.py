@@ -13,6 +13,11 @@ import datetime
 from datetime import timezone
 from typing import Dict, List, Optional, Tuple
 
+from config import settings
+
+# Evaluated at collection time so gated tests skip before their fixtures create connections
+local_only = pytest.mark.skipif(not settings.is_local, reason="Temporal tests only run locally")
+
 
 @pytest.mark.asyncio
 @pytest.mark.requires_temporal
@@ -186,13 +191,11 @@ class TestTemporalSchedules:
 
         return f"{minute_part} {hour_part} {day_part} {month_part} {weekday_part}"
 
+    @local_only
     async def test_daily_schedule(
-        self, api_client: httpx.AsyncClient, source_connection_fast: dict, config
+        self, api_client: httpx.AsyncClient, source_connection_fast: dict
     ):
         """Test updating to daily schedule."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         conn_id = source_connection_fast["id"]
 
         # Update to daily schedule
@@ -213,13 +216,11 @@ class TestTemporalSchedules:
         has_schedule, matching = await self._check_temporal_schedules(sync_id, "0 0 * * *")
         assert has_schedule, "Should have daily schedule in Temporal"
 
+    @local_only
     async def test_hourly_schedule(
-        self, api_client: httpx.AsyncClient, source_connection_fast: dict, config
+        self, api_client: httpx.AsyncClient, source_connection_fast: dict
     ):
         """Test updating to hourly schedule."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         conn_id = source_connection_fast["id"]
 
         # Update to hourly schedule
@@ -236,16 +237,13 @@ class TestTemporalSchedules:
         has_schedule, matching = await self._check_temporal_schedules(sync_id, "0 * * * *")
         assert has_schedule, "Should have hourly schedule in Temporal"
 
+    @local_only
     async def test_minute_level_schedule_rejection(
         self,
         api_client,
         source_connection_fast,
-        config,
     ):
         """Test that minute-level schedules are rejected for non-continuous sources."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         conn_id = source_connection_fast["id"]
 
         # Try minute-level schedule (should fail for Todoist)
@@ -258,13 +256,11 @@ class TestTemporalSchedules:
         detail = error.get("detail", "").lower()
         assert "does not support continuous" in detail or "minimum schedule interval" in detail
 
+    @local_only
     async def test_schedule_removal(
-        self, api_client: httpx.AsyncClient, source_connection_fast: dict, config
+        self, api_client: httpx.AsyncClient, source_connection_fast: dict
     ):
         """Test removing schedule deletes Temporal schedule."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         conn_id = source_connection_fast["id"]
         sync_id = await self._get_sync_id(api_client, conn_id)
 
@@ -288,13 +284,11 @@ class TestTemporalSchedules:
         # Should have fewer schedules with this CRON
         assert len(schedules_after) < len(schedules_before)
 
+    @local_only
     async def test_schedule_re_enable(
-        self, api_client: httpx.AsyncClient, source_connection_fast: dict, config
+        self, api_client: httpx.AsyncClient, source_connection_fast: dict
     ):
         """Test re-enabling schedule creates new Temporal schedule."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         conn_id = source_connection_fast["id"]
         sync_id = await self._get_sync_id(api_client, conn_id)
 
@@ -346,13 +340,11 @@ class TestTemporalSchedules:
         assert updated["description"] == "Testing combined updates"
         assert updated["schedule"]["cron"] == "15 3 * * 1"
 
+    @local_only
     async def test_minute_level_for_continuous_source(
-        self, api_client: httpx.AsyncClient, source_connection_continuous_slow: dict, config
+        self, api_client: httpx.AsyncClient, source_connection_continuous_slow: dict
     ):
         """Test minute-level schedules work for continuous sources."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         conn_id = source_connection_continuous_slow["id"]
         sync_id = await self._get_sync_id(api_client, conn_id)
 
@@ -668,13 +660,11 @@ class TestTemporalSchedules:
 
     # ============= SCHEDULE EXECUTION TESTS =============
 
+    @local_only
     async def test_minute_schedule_executes_sync(
         self, api_client: httpx.AsyncClient, collection: Dict, config, composio_auth_provider: Dict
     ):
         """Test that a minute-level schedule actually triggers sync execution."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         # Calculate optimal timing to ensure we catch an execution
         now = datetime.datetime.now(timezone.utc)
         seconds_into_minute = now.second
@@ -743,13 +733,11 @@ class TestTemporalSchedules:
         # Cleanup
         await api_client.delete(f"/source-connections/{conn_id}")
 
+    @local_only
     async def test_hourly_schedule_executes_sync(
         self, api_client: httpx.AsyncClient, collection: Dict, config
     ):
         """Test that an hourly schedule triggers sync every hour."""
-        if not config.is_local:
-            pytest.skip("Temporal tests only run locally")
-
         # Calculate optimal target minute for testing
         from datetime import timezone
 
@@ -7,12 +7,42 @@ Tests source connections that use direct authentication (API keys).
 import pytest
 import httpx
 import asyncio
+import time
 from typing import Dict
 
 
 class TestDirectAuthentication:
     """Test suite for direct authentication source connections."""
 
+    async def _wait_for_sync(
+        self,
+        api_client: httpx.AsyncClient,
+        connection_id: str,
+        *,
+        timeout_seconds: float = 60,
+        interval_seconds: float = 2,
+    ) -> Dict:
+        """Poll the source connection until its last job reaches a terminal status or timeout.
+
+        Returns the latest connection payload so callers can assert on it directly.
+        """
+        url = f"/source-connections/{connection_id}"
+        deadline = time.monotonic() + timeout_seconds
+
+        while True:
+            response = await api_client.get(url)
+            response.raise_for_status()
+            payload = response.json()
+
+            last_job = (payload.get("sync") or {}).get("last_job") or {}
+            status = (last_job.get("status") or "").lower()
+            if status in {"completed", "failed", "cancelled"}:
+                return payload
+            if time.monotonic() >= deadline:
+                return payload
+
+            await asyncio.sleep(interval_seconds)
+
     @pytest.mark.asyncio
     async def test_create_stripe_connection(
         self, api_client: httpx.AsyncClient, collection: Dict, config
@@ -176,11 +206,7 @@ class TestDirectAuthentication:
         connection = response.json()
 
         # Wait for sync to complete
-        await asyncio.sleep(30)  # Wait for sync to process
-
-        response = await api_client.get(f"/source-connections/{connection['id']}")
-        response.raise_for_status()
-        updated_connection = response.json()
+        updated_connection = await self._wait_for_sync(api_client, connection["id"])
 
         assert updated_connection["sync"]["last_job"]["status"] in ["completed", "running"]
         # Verify individual entity metrics are tracked
@@ -0,0 +1,316 @@
+"""Tests for the GitLab source connector.
+
+Drives pagination and entity generation against an in-memory GitLab API
+served through httpx.MockTransport.
+"""
+
+import asyncio
+import base64
+import gc
+import json
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from airweave.platform.sources.gitlab import GitLabSource
+
+API_URL = "https://gitlab.example.com/api/v4/items"
+
+
+def _page(items, next_page=""):
+    """Build a GitLab list response advertising the next page in its header."""
+    return httpx.Response(200, json=items, headers={"x-next-page": next_page})
+
+
+def _client(handler) -> httpx.AsyncClient:
+    """Create an httpx client whose requests are answered by handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+async def source():
+    """Create a GitLab source authenticated with a static token."""
+    return await GitLabSource.create(access_token="test-token")
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    """Retry rate-limited requests immediately instead of backing off."""
+    monkeypatch.setattr(GitLabSource._get_response_with_auth.retry, "wait", wait_none())
+
+
+class TestGitLabPagination:
+    """Test streaming of paginated GitLab API results."""
+
+    @pytest.mark.asyncio
+    async def test_paginated_results_follow_next_page_header(self, source):
+        """Test that pages are yielded in order until x-next-page is empty."""
+        requested_pages = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            requested_pages.append(page)
+            next_page = str(page + 1) if page < 3 else ""
+            return _page([{"id": page * 10}, {"id": page * 10 + 1}], next_page)
+
+        async with _client(handler) as client:
+            items = [item async for item in source._get_paginated_results(client, API_URL)]
+
+        assert [item["id"] for item in items] == [10, 11, 20, 21, 30, 31]
+        assert requested_pages == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_paginated_results_stop_without_next_page_header(self, source):
+        """Test that a response without x-next-page ends pagination."""
+        requested_pages = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_pages.append(int(request.url.params["page"]))
+            return httpx.Response(200, json=[{"id": 1}])
+
+        async with _client(handler) as client:
+            items = [item async for item in source._get_paginated_results(client, API_URL)]
+
+        assert items == [{"id": 1}]
+        assert requested_pages == [1]
+
+    @pytest.mark.asyncio
+    async def test_prefetched_page_error_raised_when_consumed(self, source):
+        """Test that a failed prefetch surfaces after the preceding page is yielded."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["page"] == "1":
+                return _page([{"id": 1}, {"id": 2}], "2")
+            return httpx.Response(500, json={"message": "boom"})
+
+        items = []
+        async with _client(handler) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                async for item in source._get_paginated_results(client, API_URL):
+                    items.append(item)
+
+        assert items == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_early_close_cancels_pending_prefetch(self, source):
+        """Test that closing the generator cancels an in-flight prefetch."""
+        prefetch_started = asyncio.Event()
+        prefetch_cancelled = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["page"] == "1":
+                return _page([{"id": 1}], "2")
+            prefetch_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                prefetch_cancelled.set()
+                raise
+
+        async with _client(handler) as client:
+            results = source._get_paginated_results(client, API_URL)
+            assert await results.__anext__() == {"id": 1}
+            await asyncio.wait_for(prefetch_started.wait(), timeout=1)
+            await results.aclose()
+            await asyncio.wait_for(prefetch_cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_early_close_retrieves_failed_prefetch(self, source):
+        """Test that a prefetch which already failed is not reported as never retrieved."""
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        previous_handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["page"] == "1":
+                return _page([{"id": 1}], "2")
+            return httpx.Response(500, json={"message": "boom"})
+
+        try:
+            async with _client(handler) as client:
+                results = source._get_paginated_results(client, API_URL)
+                assert await results.__anext__() == {"id": 1}
+                # Let the prefetch fail before the consumer stops
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                await results.aclose()
+                del results
+                gc.collect()
+        finally:
+            loop.set_exception_handler(previous_handler)
+
+        assert unhandled == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_page_is_retried(self, source, no_retry_wait):
+        """Test that a 429 on a page is retried instead of ending the listing."""
+        attempts = {"1": 0, "2": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = request.url.params["page"]
+            attempts[page] += 1
+            if page == "2" and attempts[page] == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return _page([{"id": int(page)}], "2" if page == "1" else "")
+
+        async with _client(handler) as client:
+            items = [item async for item in source._get_paginated_results(client, API_URL)]
+
+        assert items == [{"id": 1}, {"id": 2}]
+        assert attempts == {"1": 1, "2": 2}
+
+
+def _project(project_id: int) -> dict:
+    return {
+        "id": project_id,
+        "name": f"project-{project_id}",
+        "created_at": "2024-01-01T00:00:00Z",
+        "last_activity_at": "2024-02-01T00:00:00Z",
+        "path": f"project-{project_id}",
+        "path_with_namespace": f"group/project-{project_id}",
+        "visibility": "private",
+        "default_branch": "main",
+        "web_url": f"https://gitlab.com/group/project-{project_id}",
+    }
+
+
+def _gitlab_api(request: httpx.Request) -> httpx.Response:
+    """Serve a small GitLab instance: two projects, each with nested files, issues and MRs."""
+    parts = request.url.path.removeprefix("/api/v4/").split("/")
+    page = int(request.url.params.get("page", "1"))
+
+    if parts == ["user"]:
+        return httpx.Response(
+            200,
+            json={
+                "id": 1,
+                "name": "User",
+                "username": "user",
+                "state": "active",
+                "created_at": "2020-01-01T00:00:00Z",
+            },
+        )
+    if parts == ["projects"]:
+        # One project per page to exercise pagination of the project list
+        return _page([_project(page)], "2" if page == 1 else "")
+
+    project_id = int(parts[1])
+    resource = "/".join(parts[2:4])
+    if resource == "repository/tree":
+        path = request.url.params.get("path", "")
+        if path == "":
+            return _page([{"path": "src", "type": "tree"}, {"path": "README.md", "type": "blob"}])
+        return _page([{"path": f"{path}/main.py", "type": "blob"}])
+    if resource == "repository/files":
+        content = f"print({project_id})\n".encode()
+        return httpx.Response(
+            200,
+            json={
+                "size": len(content),
+                "encoding": "base64",
+                "content": base64.b64encode(content).decode(),
+                "blob_id": f"blob-{project_id}",
+            },
+        )
+    if resource == "issues":
+        return _page(
+            [
+                {
+                    "id": project_id * 100 + iid,
+                    "iid": iid,
+                    "title": f"Issue {iid}",
+                    "state": "opened",
+                    "created_at": "2024-01-01T00:00:00Z",
+                }
+                for iid in range(1, 4)
+            ]
+        )
+    if resource == "merge_requests":
+        return _page(
+            [
+                {
+                    "id": project_id * 1000,
+                    "iid": 1,
+                    "title": "MR",
+                    "state": "opened",
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "source_branch": "feature",
+                    "target_branch": "main",
+                }
+            ]
+        )
+    return httpx.Response(404, json={"message": "404 Not Found"})
+
+
+class _FakeFileDownloader:
+    """Mark files as saved without writing them to disk."""
+
+    async def save_bytes(self, entity, content, filename_with_extension, logger):
+        entity.local_path = f"/tmp/{entity.full_path}"
+
+
+async def _collect_entities(batch_generation: bool) -> list:
+    source = await GitLabSource.create(
+        access_token="test-token", config={"batch_generation": batch_generation}
+    )
+    source.set_http_client_factory(
+        lambda **kwargs: httpx.AsyncClient(transport=httpx.MockTransport(_gitlab_api), **kwargs)
+    )
+    source.set_file_downloader(_FakeFileDownloader())
+    return [entity async for entity in source.generate_entities()]
+
+
+class TestGitLabGenerateEntities:
+    """Test entity generation across projects, repositories, issues and MRs."""
+
+    @pytest.mark.asyncio
+    async def test_batch_generation_yields_same_entities_as_sequential(self):
+        """Test that concurrent project processing yields exactly the sequential entities."""
+        sequential = await _collect_entities(batch_generation=False)
+        concurrent = await _collect_entities(batch_generation=True)
+
+        def _serialize(entities):
+            return sorted(
+                json.dumps(entity.model_dump(mode="json"), sort_keys=True) for entity in entities
+            )
+
+        # user + per project: project, directory, 2 files, 3 issues, 1 MR
+        assert len(sequential) == 1 + 2 * 8
+        assert _serialize(concurrent) == _serialize(sequential)
+
+    @pytest.mark.asyncio
+    async def test_project_listing_error_leaves_no_workers_running(self):
+        """Test that a failed /projects page stops all GitLab requests, not just the listing."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/projects") and request.url.params["page"] == "2":
+                return httpx.Response(500, json={"message": "boom"})
+            # Keep project work in flight while the second /projects page fails
+            await asyncio.sleep(0.01)
+            return _gitlab_api(request)
+
+        source = await GitLabSource.create(access_token="test-token")
+        source.set_http_client_factory(
+            lambda **kwargs: httpx.AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+        )
+        source.set_file_downloader(_FakeFileDownloader())
+
+        requested_urls = []
+        get_response_with_auth = source._get_response_with_auth
+
+        async def recording_get(client, url, params=None):
+            requested_urls.append(url)
+            return await get_response_with_auth(client, url, params)
+
+        source._get_response_with_auth = recording_get
+
+        with pytest.raises(httpx.HTTPStatusError):
+            async for _ in source.generate_entities():
+                pass
+        requests_at_failure = list(requested_urls)
+
+        await asyncio.sleep(0.1)
+
+        assert requested_urls == requests_at_failure